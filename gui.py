@@ -5,16 +5,25 @@ from __future__ import annotations
 import colorsys
 import math
 import random
-from typing import Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pygame
 
-from logic import Ball, Color, DeleteZone, GameLogic
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:  # pragma: no cover - depends on the pygame build
+    Renderer = Texture = Window = None
+
+from logic import Color, DeleteZone, GameLogic, Inventory
 
 # --------------------------------------------------------------------------- #
 # Configuration
 # --------------------------------------------------------------------------- #
+WINDOW_TITLE = "Color Vacuum Playground"
 WINDOW_SIZE: Tuple[int, int] = (1100, 720)
+# Experimental, not yet measured against the surface path on real GPUs.
+USE_GPU_RENDERER = False
 BACKGROUND_COLOR = (250, 250, 250)
 PLAYFIELD_COLOR = (255, 255, 255)
 INVENTORY_COLOR = (240, 244, 248)
@@ -29,6 +38,14 @@ INVENTORY_STRIP_HEIGHT = 130.0
 DELETE_ZONE_SIZE = (150, 90)
 DELETE_ZONE_COLOR = (255, 210, 210)
 DELETE_ZONE_BORDER = (206, 106, 106)
+MOUSE_RING_COLOR = (180, 190, 220)
+HUD_STATIC_LINES = (
+    "Left click / hold — vacuum balls",
+    "Right click — spit last stored ball",
+    "Esc or Q — exit",
+)
+
+RGB = Tuple[int, int, int]
 
 
 def _random_color() -> Color:
@@ -55,14 +72,28 @@ def _spawn_initial_balls(game: GameLogic, play_area_height: float) -> None:
         game.spawn_ball(position, velocity, radius, _random_color())
 
 
-def _color_to_rgb(color: Color) -> Tuple[int, int, int]:
-    return tuple(int(max(0.0, min(1.0, c)) * 255) for c in color)
+def _create_renderer() -> Optional[Renderer]:
+    """Open the window through SDL2's renderer API, or None to fall back."""
+    if Renderer is None:
+        return None
+
+    window = None
+    try:
+        window = Window(WINDOW_TITLE, size=WINDOW_SIZE)
+        # Only hardware renderers; SDL's software one is slower than surfaces.
+        return Renderer(window, accelerated=1)
+    except (pygame.error, RuntimeError):  # _sdl2 errors subclass RuntimeError
+        if window is not None:
+            window.destroy()
+        return None
 
 
 def main() -> None:
     pygame.init()
-    pygame.display.set_caption("Color Vacuum Playground")
-    screen = pygame.display.set_mode(WINDOW_SIZE)
+    renderer = _create_renderer() if USE_GPU_RENDERER else None
+    if renderer is None:
+        pygame.display.set_caption(WINDOW_TITLE)
+        screen = pygame.display.set_mode(WINDOW_SIZE)
     clock = pygame.time.Clock()
     font = pygame.font.SysFont("Segoe UI", 17)
 
@@ -85,6 +116,11 @@ def main() -> None:
     )
 
     _spawn_initial_balls(game, play_area_height)
+    background = _build_background(font, game, delete_zone, play_area_height)
+    if renderer is None:
+        background = background.convert()
+    hud = _Hud(font)
+    gpu_scene = _GpuScene(renderer, background) if renderer else None
 
     running = True
     last_mouse_position = pygame.mouse.get_pos()
@@ -107,8 +143,11 @@ def main() -> None:
 
         game.update(dt)
 
-        _draw_scene(screen, font, game, delete_zone, mouse_pos, play_area_height)
-        pygame.display.flip()
+        if gpu_scene is not None:
+            gpu_scene.draw(hud, game, mouse_pos)
+        else:
+            _draw_scene(screen, background, hud, game, mouse_pos)
+            pygame.display.flip()
 
         last_mouse_position = mouse_pos
 
@@ -131,17 +170,41 @@ def _spit_ball(
 
 def _draw_scene(
     screen: pygame.Surface,
+    background: pygame.Surface,
+    hud: _Hud,
+    game: GameLogic,
+    mouse_pos: Tuple[int, int],
+) -> None:
+    screen.blit(background, (0, 0))
+
+    positions, radii, colors = game.ball_arrays()
+    _draw_circles(screen, *_ball_batch(positions, radii, colors, game.inventory))
+
+    # Mouse influence radius
+    pygame.draw.circle(
+        screen,
+        MOUSE_RING_COLOR,
+        mouse_pos,
+        MOUSE_INFLUENCE_RADIUS,
+        width=1,
+    )
+
+    screen.blits(hud.surfaces(len(radii), len(game.inventory)), doreturn=False)
+
+
+def _build_background(
     font: pygame.font.Font,
     game: GameLogic,
     delete_zone: DeleteZone,
-    mouse_pos: Tuple[int, int],
     play_area_height: float,
-) -> None:
-    screen.fill(BACKGROUND_COLOR)
+) -> pygame.Surface:
+    """Pre-compose the static playfield, delete zone and inventory strip."""
+    background = pygame.Surface(WINDOW_SIZE)
+    background.fill(BACKGROUND_COLOR)
 
     # Play area
     play_rect = pygame.Rect(0, 0, game.width, play_area_height)
-    pygame.draw.rect(screen, PLAYFIELD_COLOR, play_rect)
+    pygame.draw.rect(background, PLAYFIELD_COLOR, play_rect)
 
     # Delete zone
     delete_rect = pygame.Rect(
@@ -150,70 +213,150 @@ def _draw_scene(
         delete_zone.max_x - delete_zone.min_x,
         delete_zone.max_y - delete_zone.min_y,
     )
-    pygame.draw.rect(screen, DELETE_ZONE_COLOR, delete_rect, border_radius=10)
-    pygame.draw.rect(screen, DELETE_ZONE_BORDER, delete_rect, width=3, border_radius=10)
+    pygame.draw.rect(background, DELETE_ZONE_COLOR, delete_rect, border_radius=10)
+    pygame.draw.rect(background, DELETE_ZONE_BORDER, delete_rect, width=3, border_radius=10)
 
     # Inventory strip
     inventory_rect = pygame.Rect(0, play_area_height, game.width, game.height - play_area_height)
-    pygame.draw.rect(screen, INVENTORY_COLOR, inventory_rect)
+    pygame.draw.rect(background, INVENTORY_COLOR, inventory_rect)
 
-    active_balls = game.balls()
+    label = font.render("Delete zone", True, DELETE_ZONE_BORDER)
+    background.blit(label, (delete_zone.min_x + 8, delete_zone.min_y + 8))
 
-    # Balls on playfield
-    for ball in active_balls:
-        pygame.draw.circle(
-            screen,
-            _color_to_rgb(ball.color),
-            (int(ball.position.x), int(ball.position.y)),
-            int(ball.radius),
-        )
+    inv_label = font.render("Inventory strip", True, HUD_TEXT_COLOR)
+    background.blit(inv_label, (16, play_area_height + 10))
+    return background
 
+
+def _ball_batch(
+    positions: np.ndarray,
+    radii: np.ndarray,
+    colors: np.ndarray,
+    inventory: Inventory,
+) -> Tuple[List[RGB], List[Sequence[int]], List[int]]:
+    """Colors, integer centers and radii of every ball to draw, playfield first."""
     # Inventory balls (use same drawing for clarity)
-    for ball in game.inventory:
-        pygame.draw.circle(
-            screen,
-            _color_to_rgb(ball.color),
-            (int(ball.position.x), int(ball.position.y)),
-            int(ball.radius),
+    if len(inventory):
+        positions = np.concatenate(
+            (positions, np.array([(ball.position.x, ball.position.y) for ball in inventory]))
         )
-
-    # Mouse influence radius
-    pygame.draw.circle(
-        screen,
-        (180, 190, 220),
-        mouse_pos,
-        MOUSE_INFLUENCE_RADIUS,
-        width=1,
+        radii = np.concatenate((radii, np.array([ball.radius for ball in inventory])))
+        colors = np.concatenate((colors, np.array([ball.color for ball in inventory])))
+
+    rgb = (np.clip(colors, 0.0, 1.0) * 255).astype(np.uint8)
+    return (
+        list(map(tuple, rgb.tolist())),
+        positions.astype(int).tolist(),
+        radii.astype(int).tolist(),
     )
 
-    _draw_hud(screen, font, active_balls, len(game.inventory), delete_zone, play_area_height)
-
 
-def _draw_hud(
+def _draw_circles(
     screen: pygame.Surface,
-    font: pygame.font.Font,
-    active_balls: Tuple[Ball, ...],
-    inventory_count: int,
-    delete_zone: DeleteZone,
-    play_area_height: float,
+    colors: List[RGB],
+    centers: List[Sequence[int]],
+    radii: List[int],
 ) -> None:
-    lines = [
-        "Left click / hold — vacuum balls",
-        "Right click — spit last stored ball",
-        "Esc or Q — exit",
-        f"Active balls: {len(active_balls)}",
-        f"Inventory: {inventory_count}",
-    ]
-
-    for idx, text in enumerate(lines):
-        surface = font.render(text, True, HUD_TEXT_COLOR)
-        screen.blit(surface, (16, 16 + idx * 20))
-
-    label = font.render("Delete zone", True, DELETE_ZONE_BORDER)
-    screen.blit(label, (delete_zone.min_x + 8, delete_zone.min_y + 8))
-
-    inv_label = font.render("Inventory strip", True, HUD_TEXT_COLOR)
-    screen.blit(inv_label, (16, play_area_height + 10))
+    draw_circle = pygame.draw.circle
+    for color, center, radius in zip(colors, centers, radii):
+        draw_circle(screen, color, center, radius)
+
+
+class _Hud:
+    """HUD text surfaces: static lines render once, counters only on change."""
+
+    def __init__(self, font: pygame.font.Font) -> None:
+        self._font = font
+        self._static = [self._render(text) for text in HUD_STATIC_LINES]
+        self._active_count = self._inventory_count = 0
+        self._active_line = self._render("Active balls: 0")
+        self._inventory_line = self._render("Inventory: 0")
+        self._surfaces = self._layout()
+
+    def surfaces(
+        self,
+        active_count: int,
+        inventory_count: int,
+    ) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Blit list for the HUD; the same list object while nothing changed."""
+        if active_count == self._active_count and inventory_count == self._inventory_count:
+            return self._surfaces
+
+        if active_count != self._active_count:
+            self._active_count = active_count
+            self._active_line = self._render(f"Active balls: {active_count}")
+        if inventory_count != self._inventory_count:
+            self._inventory_count = inventory_count
+            self._inventory_line = self._render(f"Inventory: {inventory_count}")
+        self._surfaces = self._layout()
+        return self._surfaces
+
+    def _layout(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        lines = [*self._static, self._active_line, self._inventory_line]
+        return [(surface, (16, 16 + idx * 20)) for idx, surface in enumerate(lines)]
+
+    def _render(self, text: str) -> pygame.Surface:
+        return self._font.render(text, True, HUD_TEXT_COLOR)
+
+
+class _GpuScene:
+    """Draws the scene through an SDL2 renderer instead of the display surface.
+
+    The static background is uploaded once; every ball is a cached white disc
+    texture drawn with a per-ball color modulation, so rasterization happens
+    on the GPU.
+    """
+
+    def __init__(self, renderer: Renderer, background: pygame.Surface) -> None:
+        self._renderer = renderer
+        self._discs: Dict[int, Texture] = {}
+        self._background = Texture.from_surface(renderer, background)
+        self._hud_source: Optional[List[Tuple[pygame.Surface, Tuple[int, int]]]] = None
+        self._hud_textures: List[Tuple[Texture, Tuple[int, int]]] = []
+
+        ring_radius = MOUSE_INFLUENCE_RADIUS
+        ring = pygame.Surface((2 * ring_radius + 1, 2 * ring_radius + 1), pygame.SRCALPHA)
+        pygame.draw.circle(ring, MOUSE_RING_COLOR, (ring_radius, ring_radius), ring_radius, width=1)
+        self._ring = Texture.from_surface(renderer, ring)
+
+    def draw(
+        self,
+        hud: _Hud,
+        game: GameLogic,
+        mouse_pos: Tuple[int, int],
+    ) -> None:
+        self._background.draw()
+
+        positions, radii, colors = game.ball_arrays()
+        batch = _ball_batch(positions, radii, colors, game.inventory)
+        for color, (x, y), radius in zip(*batch):
+            disc = self._disc(radius)
+            disc.color = color
+            disc.draw(dstrect=(x - radius, y - radius))
+
+        ring_radius = MOUSE_INFLUENCE_RADIUS
+        self._ring.draw(dstrect=(mouse_pos[0] - ring_radius, mouse_pos[1] - ring_radius))
+
+        hud_surfaces = hud.surfaces(len(radii), len(game.inventory))
+        if hud_surfaces is not self._hud_source:
+            self._hud_source = hud_surfaces
+            self._hud_textures = [
+                (Texture.from_surface(self._renderer, surface), position)
+                for surface, position in hud_surfaces
+            ]
+        for texture, position in self._hud_textures:
+            texture.draw(dstrect=position)
+
+        self._renderer.present()
+
+    def _disc(self, radius: int) -> Texture:
+        disc = self._discs.get(radius)
+        if disc is None:
+            surface = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (255, 255, 255), (radius, radius), radius)
+            disc = Texture.from_surface(self._renderer, surface)
+            self._discs[radius] = disc
+        return disc
 
 
 if __name__ == "__main__":
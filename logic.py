@@ -8,21 +8,124 @@ The module is UI-agnostic and focuses solely on state updates and rules:
     * optional delete zone that removes balls crossing it,
     * a capture strip along the bottom for stored balls,
     * automatic refilling so the playfield never runs dry.
+
+Active balls are stored as parallel NumPy arrays (positions, velocities,
+radii, HSV colors); `Ball` objects, with RGB colors, are only materialized at
+the API boundary.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import colorsys
 import math
 import itertools
 import random
 
-Color = Tuple[float, float, float]  # RGB, normalized [0.0, 1.0]
+import numpy as np
 
+try:  # Optional: compiles the pairwise collision kernel.
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
 
-@dataclass
+Color = Tuple[float, float, float]  # RGB, normalized [0.0, 1.0]
+HsvColor = Tuple[float, float, float]  # hue, saturation, value in [0.0, 1.0]
+
+_MIN_CAPACITY = 64
+_TAU = math.tau
+_COS = math.cos
+_SIN = math.sin
+_DEFAULT_SPEED_RANGE = (40.0, 140.0)
+_DEFAULT_RADIUS_RANGE = (12.0, 26.0)
+_BROADCAST_MIN_BALLS = 16
+_GRID_MIN_BALLS = 128
+
+GridCell = Tuple[int, int]
+
+
+def _touching_pairs_loop(pos: np.ndarray, radius: np.ndarray) -> np.ndarray:
+    """Fused pairwise overlap test returning an `(P, 2)` array of `a < b` pairs.
+
+    Written as plain scalar loops so Numba can compile it without the
+    `(N, N, 2)` temporaries of the broadcast version. Each row first fills a
+    branch-free hit mask (which vectorizes) and is only rescanned for hits.
+    """
+    count = pos.shape[0]
+    xs = np.ascontiguousarray(pos[:, 0])
+    ys = np.ascontiguousarray(pos[:, 1])
+    hits = np.empty(count, dtype=np.bool_)
+    pairs = np.empty((max(16, 2 * count), 2), dtype=np.int64)
+    found = 0
+    for idx_a in range(count):
+        ax = xs[idx_a]
+        ay = ys[idx_a]
+        radius_a = radius[idx_a]
+        row_hits = 0
+        for idx_b in range(idx_a + 1, count):
+            reach = radius_a + radius[idx_b]
+            dx = ax - xs[idx_b]
+            dy = ay - ys[idx_b]
+            hit = dx * dx + dy * dy <= reach * reach
+            hits[idx_b] = hit
+            row_hits += hit
+        if row_hits == 0:
+            continue
+
+        if found + row_hits > pairs.shape[0]:
+            grown = np.empty((2 * (found + row_hits), 2), dtype=np.int64)
+            grown[:found] = pairs[:found]
+            pairs = grown
+        for idx_b in range(idx_a + 1, count):
+            if hits[idx_b]:
+                pairs[found, 0] = idx_a
+                pairs[found, 1] = idx_b
+                found += 1
+    return pairs[:found]
+
+
+_touching_pairs_kernel = (
+    njit(cache=True, fastmath=True)(_touching_pairs_loop) if njit is not None else None
+)
+
+
+def _component_labels(count: int, pairs: np.ndarray) -> np.ndarray:
+    """Label every ball with the smallest index of its touching cluster.
+
+    Propagates minimum labels along the `(P, 2)` edges (with pointer jumping)
+    until a fixed point; clusters are small, so this takes a few passes.
+    """
+    labels = np.arange(count)
+    idx_a = pairs[:, 0]
+    idx_b = pairs[:, 1]
+    while True:
+        edge_min = np.minimum(labels[idx_a], labels[idx_b])
+        updated = labels.copy()
+        np.minimum.at(updated, idx_a, edge_min)
+        np.minimum.at(updated, idx_b, edge_min)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def _hsv_to_rgb(hsv: np.ndarray) -> np.ndarray:
+    """Vectorized `colorsys.hsv_to_rgb` over the last axis."""
+    hue, saturation, value = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+    sector = np.floor(hue * 6.0)
+    fraction = hue * 6.0 - sector
+    sector = sector.astype(np.intp) % 6
+    p = value * (1.0 - saturation)
+    q = value * (1.0 - saturation * fraction)
+    t = value * (1.0 - saturation * (1.0 - fraction))
+    red = np.choose(sector, (value, q, p, p, t, value))
+    green = np.choose(sector, (t, value, value, q, p, p))
+    blue = np.choose(sector, (p, p, t, value, value, q))
+    return np.stack((red, green, blue), axis=-1)
+
+
+@dataclass(slots=True)
 class Vec2:
     """Simple 2D vector utility."""
 
@@ -42,7 +145,7 @@ class Vec2:
         return math.hypot(self.x, self.y)
 
 
-@dataclass
+@dataclass(slots=True)
 class Ball:
     """Represents a single ball on the playfield."""
 
@@ -54,7 +157,7 @@ class Ball:
     stored_velocity: Vec2 = field(default_factory=lambda: Vec2(0.0, 0.0))
 
 
-@dataclass
+@dataclass(slots=True)
 class Inventory:
     """Stores balls captured by the mouse vacuum."""
 
@@ -73,7 +176,7 @@ class Inventory:
         return iter(self._balls)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteZone:
     """Axis-aligned rectangle that deletes balls entering it."""
 
@@ -88,6 +191,15 @@ class DeleteZone:
             and self.min_y <= position.y <= self.max_y
         )
 
+    def contains_points(self, points: np.ndarray) -> np.ndarray:
+        """Vectorized `contains` for an `(N, 2)` array of positions."""
+        xs = points[:, 0]
+        ys = points[:, 1]
+        return (
+            (self.min_x <= xs) & (xs <= self.max_x)
+            & (self.min_y <= ys) & (ys <= self.max_y)
+        )
+
 
 class GameLogic:
     """Encapsulates simulation, capture strip layout, and auto-refill logic."""
@@ -114,14 +226,33 @@ class GameLogic:
         self.height = height
         self.delete_zone = delete_zone
         self.inventory = Inventory()
-        self._balls: List[Ball] = []
         self._id_counter = itertools.count()
         self.inventory_strip_height = max(0.0, inventory_strip_height)
         self.inventory_slot_size = max(1.0, inventory_slot_size)
         self.inventory_padding = max(0.0, inventory_padding)
         self.refill_on_remove = refill_on_remove
         self._refill_generator = refill_generator
-        self._rng = random.Random(rng_seed)
+        self._rng = np.random.default_rng(rng_seed)
+        # Single draws (spit velocities) are far cheaper through random.Random.
+        self._scalar_rng = random.Random(rng_seed)
+
+        # Structure-of-arrays storage for active balls; only the first
+        # `_count` rows are live, the rest is spare capacity.
+        self._count = 0
+        self._ids = np.empty(0, dtype=np.int64)
+        self._pos = np.empty((0, 2))
+        self._vel = np.empty((0, 2))
+        self._radius = np.empty(0)
+        self._color_hsv = np.empty((0, 3))
+
+        # Inventory slot centers, recomputed only when the layout inputs change.
+        self._layout_key: Optional[Tuple[float, ...]] = None
+        self._slot_positions = np.empty((0, 2))
+
+        # Uniform spatial hash over active balls, rebuilt lazily after any
+        # position or membership change.
+        self._grid: Optional[Dict[GridCell, List[int]]] = None
+        self._grid_cell_size = 1.0
 
     # --------------------------------------------------------------------- #
     # Public API
@@ -134,38 +265,45 @@ class GameLogic:
         color: Color,
     ) -> Ball:
         """Create and register a new ball on the playfield."""
-        ball = Ball(
-            id=next(self._id_counter),
-            position=Vec2(*position),
-            velocity=Vec2(*velocity),
-            radius=radius,
-            color=color,
+        idx = self._append_row(
+            next(self._id_counter),
+            position,
+            velocity,
+            radius,
+            colorsys.rgb_to_hsv(*color),
         )
-        ball.stored_velocity = ball.velocity
-        self._balls.append(ball)
-        return ball
+        return self._ball_at(idx)
 
     def update(self, dt: float) -> None:
         """Advance the simulation by `dt` seconds."""
-        for ball in list(self._balls):
-            self._move_ball(ball, dt)
-            if self.delete_zone and self.delete_zone.contains(ball.position):
-                self._balls.remove(ball)
-                self._spawn_replacement()
+        count = self._count
+        if count:
+            pos = self._pos[:count]
+            pos += self._vel[:count] * dt
+            # Wrap-around edges keep gameplay dense without extra rules.
+            np.mod(pos, (self.width, self._play_area_height()), out=pos)
+            self._grid = None
+
+            if self.delete_zone:
+                doomed = self.delete_zone.contains_points(pos)
+                removed = int(np.count_nonzero(doomed))
+                if removed:
+                    self._compact(~doomed)
+                    self._spawn_replacements(removed)
 
         self._apply_color_mixing()
 
     def suck_ball(self, pointer: Tuple[float, float], influence_radius: float) -> Optional[Ball]:
         """Vacuum the closest ball within `influence_radius` of the pointer."""
-        target = self._find_ball(pointer, influence_radius)
-        if not target:
+        idx = self._find_ball(pointer, influence_radius)
+        if idx is None:
             return None
 
-        self._balls.remove(target)
-        target.stored_velocity = target.velocity
+        target = self._ball_at(idx)
+        self._remove_at(idx)
         self.inventory.add(target)
-        self._refresh_inventory_layout()
-        self._spawn_replacement()
+        self._refresh_inventory_layout(start=len(self.inventory) - 1)
+        self._spawn_replacements(1)
         return target
 
     def spit_ball(
@@ -178,7 +316,8 @@ class GameLogic:
         if not ball:
             return None
 
-        self._refresh_inventory_layout()
+        # Only the popped tail slot changed; the remaining balls stay put.
+        self._refresh_inventory_layout(start=len(self.inventory))
         chosen_velocity = (
             Vec2(*velocity)
             if velocity is not None
@@ -191,152 +330,442 @@ class GameLogic:
         ball.position = Vec2(*position)
         ball.velocity = chosen_velocity
         ball.stored_velocity = chosen_velocity
-        self._balls.append(ball)
+        self._append_row(
+            ball.id,
+            position,
+            (chosen_velocity.x, chosen_velocity.y),
+            ball.radius,
+            colorsys.rgb_to_hsv(*ball.color),
+        )
         return ball
 
     def balls(self) -> Iterable[Ball]:
-        """Expose current balls without allowing external mutation."""
-        return tuple(self._balls)
+        """Expose snapshots of the current balls without allowing external mutation."""
+        count = self._count
+        return tuple(
+            self._make_ball(ball_id, position, velocity, radius, color)
+            for ball_id, position, velocity, radius, color in zip(
+                self._ids[:count].tolist(),
+                self._pos[:count].tolist(),
+                self._vel[:count].tolist(),
+                self._radius[:count].tolist(),
+                _hsv_to_rgb(self._color_hsv[:count]).tolist(),
+            )
+        )
+
+    def ball_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Read-only `(positions, radii, rgb_colors)` arrays of the active balls.
+
+        Meant for batched rendering: colors are converted from the HSV storage
+        in one pass, and the views are invalidated by the next simulation step.
+        """
+        count = self._count
+        views = (
+            self._pos[:count],
+            self._radius[:count],
+            _hsv_to_rgb(self._color_hsv[:count]),
+        )
+        for view in views:
+            view.flags.writeable = False
+        return views
 
     # --------------------------------------------------------------------- #
     # Internal helpers
     # --------------------------------------------------------------------- #
-    def _move_ball(self, ball: Ball, dt: float) -> None:
-        ball.position = ball.position + ball.velocity * dt
-        ball.stored_velocity = ball.velocity
-
-        # Wrap-around edges keep gameplay dense without extra rules.
-        ball.position = Vec2(
-            ball.position.x % self.width,
-            ball.position.y % self._play_area_height(),
+    def _append_row(
+        self,
+        ball_id: int,
+        position: Tuple[float, float],
+        velocity: Tuple[float, float],
+        radius: float,
+        color_hsv: HsvColor,
+    ) -> int:
+        self._reserve(1)
+        idx = self._count
+        self._ids[idx] = ball_id
+        self._pos[idx] = position
+        self._vel[idx] = velocity
+        self._radius[idx] = radius
+        self._color_hsv[idx] = color_hsv
+        self._count += 1
+        self._grid = None
+        return idx
+
+    def _reserve(self, extra: int) -> None:
+        """Grow the backing arrays geometrically to fit `extra` more rows."""
+        needed = self._count + extra
+        if needed <= len(self._ids):
+            return
+
+        capacity = max(needed, 2 * len(self._ids), _MIN_CAPACITY)
+        self._ids = self._resized(self._ids, capacity)
+        self._pos = self._resized(self._pos, capacity)
+        self._vel = self._resized(self._vel, capacity)
+        self._radius = self._resized(self._radius, capacity)
+        self._color_hsv = self._resized(self._color_hsv, capacity)
+
+    def _resized(self, array: np.ndarray, capacity: int) -> np.ndarray:
+        resized = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+        resized[: self._count] = array[: self._count]
+        return resized
+
+    def _columns(self) -> Tuple[np.ndarray, ...]:
+        return (self._ids, self._pos, self._vel, self._radius, self._color_hsv)
+
+    def _remove_at(self, idx: int) -> None:
+        """Swap-remove a single row: the last live ball takes its slot."""
+        last = self._count - 1
+        if idx != last:
+            for array in self._columns():
+                array[idx] = array[last]
+        self._count = last
+        self._grid = None
+
+    def _compact(self, keep: np.ndarray) -> None:
+        """Drop every live row whose `keep` flag is False, preserving order."""
+        count = self._count
+        remaining = int(np.count_nonzero(keep))
+        for array in self._columns():
+            array[:remaining] = array[:count][keep]
+        self._count = remaining
+        self._grid = None
+
+    def _ball_at(self, idx: int) -> Ball:
+        return self._make_ball(
+            int(self._ids[idx]),
+            self._pos[idx].tolist(),
+            self._vel[idx].tolist(),
+            float(self._radius[idx]),
+            colorsys.hsv_to_rgb(*self._color_hsv[idx].tolist()),
+        )
+
+    @staticmethod
+    def _make_ball(
+        ball_id: int,
+        position: List[float],
+        velocity: List[float],
+        radius: float,
+        color: List[float],
+    ) -> Ball:
+        return Ball(
+            id=ball_id,
+            position=Vec2(*position),
+            velocity=Vec2(*velocity),
+            radius=radius,
+            color=tuple(color),
+            stored_velocity=Vec2(*velocity),
         )
 
     def _apply_color_mixing(self) -> None:
-        """Combine colors for every touching pair of balls."""
-        for idx, ball_a in enumerate(self._balls):
-            for ball_b in self._balls[idx + 1 :]:
-                if self._are_touching(ball_a, ball_b):
-                    mixed = self._mix_colors(ball_a.color, ball_b.color)
-                    ball_a.color = mixed
-                    ball_b.color = mixed
+        """Give every cluster of touching balls one shared, mixed color.
 
-    @staticmethod
-    def _are_touching(ball_a: Ball, ball_b: Ball) -> bool:
-        distance = (ball_a.position - ball_b.position).length()
-        return distance <= (ball_a.radius + ball_b.radius)
+        Clusters are the connected components of the touching graph, so the
+        result does not depend on pair order and settles in a single frame.
+        """
+        pairs = self._touching_pairs()
+        if not len(pairs):
+            return
+
+        labels = _component_labels(self._count, pairs)
+        members = np.unique(pairs)
+        members = members[np.argsort(labels[members], kind="stable")]
+        member_labels = labels[members]
+        starts = np.flatnonzero(np.r_[True, member_labels[1:] != member_labels[:-1]])
+
+        mixed = self._mix_colors(self._color_hsv[members], starts)
+        self._color_hsv[members] = np.repeat(mixed, np.diff(np.r_[starts, len(members)]), axis=0)
+
+    def _touching_pairs(self) -> np.ndarray:
+        """`(P, 2)` index pairs `a < b` of overlapping balls, in row-major order."""
+        count = self._count
+        if _touching_pairs_kernel is not None:
+            return _touching_pairs_kernel(self._pos[:count], self._radius[:count])
+        if count >= _GRID_MIN_BALLS:
+            return np.array(self._grid_touching_pairs(), dtype=np.intp).reshape(-1, 2)
+        if count < _BROADCAST_MIN_BALLS:
+            # Building the (N, N) matrices costs more than it saves here.
+            return np.array(self._scalar_touching_pairs(), dtype=np.intp).reshape(-1, 2)
+
+        pos = self._pos[:count]
+        radius = self._radius[:count]
+        diff = pos[:, None, :] - pos[None, :, :]
+        dist_sq = np.einsum("ijk,ijk->ij", diff, diff)
+        reach = radius[:, None] + radius[None, :]
+        touching = np.triu(dist_sq <= reach * reach, k=1)
+        return np.argwhere(touching)
+
+    def _scalar_touching_pairs(self) -> List[Tuple[int, int]]:
+        """Plain double loop over Python floats for small fields."""
+        count = self._count
+        positions = self._pos[:count].tolist()
+        radii = self._radius[:count].tolist()
+
+        pairs: List[Tuple[int, int]] = []
+        for idx_a, (ax, ay) in enumerate(positions):
+            radius_a = radii[idx_a]
+            for idx_b in range(idx_a + 1, count):
+                bx, by = positions[idx_b]
+                reach = radius_a + radii[idx_b]
+                # Cheap bounding-box rejection before the squared distance.
+                dx = ax - bx
+                if dx > reach or -dx > reach:
+                    continue
+                dy = ay - by
+                if dx * dx + dy * dy <= reach * reach:
+                    pairs.append((idx_a, idx_b))
+        return pairs
+
+    def _grid_touching_pairs(self) -> List[Tuple[int, int]]:
+        """Same as `_touching_pairs`, scanning only each ball's 3x3 cell neighborhood."""
+        grid = self._spatial_grid()
+        cell_size = self._grid_cell_size
+        positions = self._pos[: self._count].tolist()
+        radii = self._radius[: self._count].tolist()
+
+        pairs: List[Tuple[int, int]] = []
+        for idx_a, (ax, ay) in enumerate(positions):
+            cell_x = int(ax // cell_size)
+            cell_y = int(ay // cell_size)
+            neighbors: List[int] = []
+            for offset_x in (-1, 0, 1):
+                for offset_y in (-1, 0, 1):
+                    neighbors.extend(grid.get((cell_x + offset_x, cell_y + offset_y), ()))
+
+            radius_a = radii[idx_a]
+            for idx_b in sorted(neighbors):
+                if idx_b <= idx_a:
+                    continue
+                bx, by = positions[idx_b]
+                reach = radius_a + radii[idx_b]
+                dx = ax - bx
+                if dx > reach or -dx > reach:
+                    continue
+                dy = ay - by
+                if dx * dx + dy * dy <= reach * reach:
+                    pairs.append((idx_a, idx_b))
+        return pairs
+
+    def _spatial_grid(self) -> Dict[GridCell, List[int]]:
+        """Bucket active balls into cells of size `2 * max_radius`.
+
+        Any two touching balls then sit in the same or adjacent cells.
+        """
+        if self._grid is not None:
+            return self._grid
+
+        count = self._count
+        self._grid_cell_size = (
+            max(1.0, 2.0 * float(self._radius[:count].max())) if count else 1.0
+        )
+        grid: Dict[GridCell, List[int]] = {}
+        cell_size = self._grid_cell_size
+        for idx, (x, y) in enumerate(self._pos[:count].tolist()):
+            grid.setdefault((int(x // cell_size), int(y // cell_size)), []).append(idx)
+        self._grid = grid
+        return grid
+
+    def _grid_candidates(self, pointer: Tuple[float, float], reach: float) -> List[int]:
+        """Indices of balls in grid cells overlapping a disk around `pointer`."""
+        grid = self._spatial_grid()
+        cell_size = self._grid_cell_size
+        min_x = int((pointer[0] - reach) // cell_size)
+        max_x = int((pointer[0] + reach) // cell_size)
+        min_y = int((pointer[1] - reach) // cell_size)
+        max_y = int((pointer[1] + reach) // cell_size)
+
+        candidates: List[int] = []
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(grid):
+            # Huge disk: walking the occupied cells is cheaper than the range.
+            for (cell_x, cell_y), indices in grid.items():
+                if min_x <= cell_x <= max_x and min_y <= cell_y <= max_y:
+                    candidates.extend(indices)
+        else:
+            for cell_x in range(min_x, max_x + 1):
+                for cell_y in range(min_y, max_y + 1):
+                    candidates.extend(grid.get((cell_x, cell_y), ()))
+        candidates.sort()
+        return candidates
 
     def _find_ball(
         self,
         pointer: Tuple[float, float],
         influence_radius: float,
-    ) -> Optional[Ball]:
-        pointer_vec = Vec2(*pointer)
-        candidates = [
-            (ball, (ball.position - pointer_vec).length() - ball.radius)
-            for ball in self._balls
-        ]
-        candidates = [
-            (ball, distance_to_surface)
-            for ball, distance_to_surface in candidates
-            if distance_to_surface <= influence_radius
-        ]
-
-        if not candidates:
+    ) -> Optional[int]:
+        count = self._count
+        if not count:
             return None
 
-        candidates.sort(key=lambda item: item[1])
-        return candidates[0][0]
+        if count >= _GRID_MIN_BALLS and math.isfinite(influence_radius):
+            max_radius = float(self._radius[:count].max())
+            indices = np.array(
+                self._grid_candidates(pointer, influence_radius + max_radius),
+                dtype=np.intp,
+            )
+            if not len(indices):
+                return None
+        else:
+            indices = np.arange(count)
+
+        pos = self._pos[indices]
+        distances_to_surface = (
+            np.hypot(pos[:, 0] - pointer[0], pos[:, 1] - pointer[1])
+            - self._radius[indices]
+        )
+        best = int(np.argmin(distances_to_surface))
+        if distances_to_surface[best] > influence_radius:
+            return None
+        return int(indices[best])
 
-    def _refresh_inventory_layout(self) -> None:
+    def _refresh_inventory_layout(self, start: int = 0) -> None:
+        """Place inventory balls from slot `start` onward.
+
+        Earlier slots keep their positions unless the layout itself changed.
+        """
         if self.inventory_strip_height <= 0:
+            # Nothing gets placed, so force a full relayout once the strip is back.
+            self._layout_key = None
             return
 
-        for idx, ball in enumerate(self.inventory):
-            self._place_ball_in_inventory(ball, idx)
+        if self._layout_inputs() != self._layout_key:
+            start = 0
+        slot_positions = self._inventory_slot_positions(len(self.inventory))
+        for ball, (x, y) in zip(
+            itertools.islice(self.inventory, start, None),
+            slot_positions[start:].tolist(),
+        ):
+            ball.position = Vec2(x, y)
+            ball.velocity = Vec2(0.0, 0.0)
+
+    def _layout_inputs(self) -> Tuple[float, ...]:
+        return (
+            self.width,
+            self.height,
+            self.inventory_strip_height,
+            self.inventory_slot_size,
+            self.inventory_padding,
+        )
 
-    def _place_ball_in_inventory(self, ball: Ball, slot_index: int) -> None:
-        slot_position = self._inventory_slot_position(slot_index)
-        ball.position = slot_position
-        ball.velocity = Vec2(0.0, 0.0)
+    def _inventory_slot_positions(self, count: int) -> np.ndarray:
+        """Centers of the first `count` inventory slots, cached per layout."""
+        layout_key = self._layout_inputs()
+        if layout_key != self._layout_key:
+            self._layout_key = layout_key
+            self._slot_positions = self._compute_slot_positions(max(count, _MIN_CAPACITY))
+        elif count > len(self._slot_positions):
+            self._slot_positions = self._compute_slot_positions(
+                max(count, 2 * len(self._slot_positions))
+            )
+        return self._slot_positions[:count]
 
-    def _inventory_slot_position(self, slot_index: int) -> Vec2:
+    def _compute_slot_positions(self, count: int) -> np.ndarray:
         safe_width = max(1.0, self.width)
         usable_width = max(1.0, safe_width - 2 * min(self.inventory_padding, safe_width / 2))
         columns = max(1, int(usable_width // self.inventory_slot_size))
         slot_width = usable_width / columns
         gutter_offset = (safe_width - usable_width) / 2
 
-        col = slot_index % columns
-        row = slot_index // columns
+        slot_indices = np.arange(count)
+        cols = slot_indices % columns
+        rows = slot_indices // columns
 
-        x = gutter_offset + slot_width * (col + 0.5)
+        xs = gutter_offset + slot_width * (cols + 0.5)
         slot_height = min(self.inventory_slot_size, max(1.0, self.inventory_strip_height))
         strip_top = max(0.0, self.height - self.inventory_strip_height)
         max_offset = max(0.0, self.inventory_strip_height - slot_height / 2)
-        row_offset = slot_height * (row + 0.5)
-        y = strip_top + min(row_offset, max_offset if max_offset > 0 else slot_height / 2)
-        y = min(self.height - slot_height / 2, y)
+        row_offsets = slot_height * (rows + 0.5)
+        ys = strip_top + np.minimum(row_offsets, max_offset if max_offset > 0 else slot_height / 2)
+        ys = np.minimum(self.height - slot_height / 2, ys)
 
-        clamped_x = min(safe_width - slot_width / 2, max(slot_width / 2, x))
-        return Vec2(clamped_x, y)
+        clamped_xs = np.minimum(safe_width - slot_width / 2, np.maximum(slot_width / 2, xs))
+        return np.stack((clamped_xs, ys), axis=-1)
 
-    def _spawn_replacement(self) -> None:
-        if not self.refill_on_remove:
+    def _spawn_replacements(self, count: int) -> None:
+        """Refill `count` removed balls, growing the arrays once for the batch."""
+        if not self.refill_on_remove or count <= 0:
             return
 
-        spawn_spec = (
-            self._refill_generator(self)
-            if self._refill_generator
-            else self._default_spawn_spec()
-        )
-
-        position, velocity, radius, color = spawn_spec
-        self.spawn_ball(position, velocity, radius, color)
-
-    def _random_velocity(self, speed_range: Tuple[float, float] = (40.0, 140.0)) -> Vec2:
-        angle = self._rng.uniform(0.0, 2 * math.pi)
-        speed = self._rng.uniform(*speed_range)
-        return Vec2(math.cos(angle) * speed, math.sin(angle) * speed)
+        if self._refill_generator:
+            self._reserve(count)
+            for _ in range(count):
+                position, velocity, radius, color = self._refill_generator(self)
+                self.spawn_ball(position, velocity, radius, color)
+            return
 
-    def _default_spawn_spec(
-        self,
-    ) -> Tuple[Tuple[float, float], Tuple[float, float], float, Color]:
-        x = self._rng.uniform(0.0, max(1.0, self.width))
-        y = self._rng.uniform(0.0, self._play_area_height())
-        radius = self._rng.uniform(12.0, 26.0)
-        velocity_vec = self._random_velocity()
-        color = self._random_color()
-        return ((x, y), (velocity_vec.x, velocity_vec.y), radius, color)
-
-    def _random_color(self) -> Color:
-        hue = self._rng.random()
-        saturation = self._rng.uniform(0.65, 1.0)
-        value = self._rng.uniform(0.7, 1.0)
-        return colorsys.hsv_to_rgb(hue, saturation, value)
+        self._append_random_balls(count)
+
+    def _random_velocity(self, speed_range: Tuple[float, float] = _DEFAULT_SPEED_RANGE) -> Vec2:
+        uniform = self._scalar_rng.uniform
+        angle = uniform(0.0, _TAU)
+        speed = uniform(*speed_range)
+        return Vec2(_COS(angle) * speed, _SIN(angle) * speed)
+
+    def _append_random_balls(self, count: int) -> None:
+        """Append `count` default balls, drawing every field in one RNG call."""
+        rng = self._rng
+        xs = rng.uniform(0.0, max(1.0, self.width), count)
+        ys = rng.uniform(0.0, self._play_area_height(), count)
+        radii = rng.uniform(*_DEFAULT_RADIUS_RANGE, count)
+        angles = rng.uniform(0.0, _TAU, count)
+        speeds = rng.uniform(*_DEFAULT_SPEED_RANGE, count)
+        hues = rng.random(count)
+        saturations = rng.uniform(0.65, 1.0, count)
+        values = rng.uniform(0.7, 1.0, count)
+
+        self._reserve(count)
+        start = self._count
+        stop = start + count
+        self._ids[start:stop] = np.fromiter(
+            itertools.islice(self._id_counter, count), dtype=np.int64, count=count
+        )
+        self._pos[start:stop] = np.column_stack((xs, ys))
+        self._vel[start:stop] = np.column_stack((np.cos(angles) * speeds, np.sin(angles) * speeds))
+        self._radius[start:stop] = radii
+        self._color_hsv[start:stop] = np.column_stack((hues, saturations, values))
+        self._count = stop
+        self._grid = None
 
     def _play_area_height(self) -> float:
         return max(1.0, self.height - self.inventory_strip_height)
 
     @staticmethod
-    def _mix_colors(color_a: Color, color_b: Color) -> Color:
-        """Blend two RGB colors with saturation boost to avoid dull whites."""
-        h1, s1, v1 = colorsys.rgb_to_hsv(*color_a)
-        h2, s2, v2 = colorsys.rgb_to_hsv(*color_b)
-
-        # Average hue along the shorter arc to create vivid transitions.
-        hue_diff = ((h2 - h1 + 0.5) % 1.0) - 0.5
-        mixed_h = (h1 + hue_diff * 0.5) % 1.0
+    def _mix_colors(colors_hsv: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """Blend runs of HSV rows (groups begin at `starts`) into one color each.
+
+        Saturation is boosted to avoid dull whites; for two colors this is the
+        classic pairwise blend.
+        """
+        hue, sat, val = colors_hsv.T
+        counts = np.diff(np.r_[starts, len(colors_hsv)])
+
+        # Average hue on the color circle, i.e. along the shorter arc.
+        angle = hue * _TAU
+        sin_sum = np.add.reduceat(np.sin(angle), starts)
+        cos_sum = np.add.reduceat(np.cos(angle), starts)
+        mixed_h = (np.arctan2(sin_sum, cos_sum) / _TAU) % 1.0
+
+        # Opposite hues cancel out and leave arctan2 with rounding noise; use
+        # the pairwise rule on the first two members instead.
+        balanced = np.hypot(sin_sum, cos_sum) < 1e-9 * counts
+        if balanced.any():
+            h1 = hue[starts]
+            h2 = hue[np.minimum(starts + 1, len(hue) - 1)]
+            pairwise_h = (h1 + ((h2 - h1 + 0.5) % 1.0 - 0.5) * 0.5) % 1.0
+            mixed_h = np.where(balanced, pairwise_h, mixed_h)
 
         # Favor higher saturation/value to keep mixes punchy.
-        mixed_s = min(1.0, (s1 + s2) / 2 + 0.2 * abs(s1 - s2))
-        mixed_v = min(1.0, max(v1, v2) * 0.9 + (v1 + v2) / 2 * 0.1)
+        sat_spread = np.maximum.reduceat(sat, starts) - np.minimum.reduceat(sat, starts)
+        mixed_s = np.minimum(1.0, np.add.reduceat(sat, starts) / counts + 0.2 * sat_spread)
+        mixed_v = np.minimum(
+            1.0,
+            np.maximum.reduceat(val, starts) * 0.9 + np.add.reduceat(val, starts) / counts * 0.1,
+        )
 
         # If the result drifts too close to white, push saturation slightly.
-        if mixed_s < 0.15 and mixed_v > 0.85:
-            mixed_s = 0.25
-            mixed_v = max(0.7, mixed_v - 0.1)
+        too_white = (mixed_s < 0.15) & (mixed_v > 0.85)
+        mixed_s = np.where(too_white, 0.25, mixed_s)
+        mixed_v = np.where(too_white, np.maximum(0.7, mixed_v - 0.1), mixed_v)
 
-        return colorsys.hsv_to_rgb(mixed_h, mixed_s, mixed_v)
+        return np.stack((mixed_h, mixed_s, mixed_v), axis=-1)
 
 
 __all__ = [